@@ -6,15 +6,25 @@ Shows all GPUs always, with clear problem descriptions
 """
 
 import argparse
-import collections
 import datetime as dt
+import functools
+import itertools
 import os
+import select
 import shutil
 import signal
 import subprocess
 import sys
+import termios
+import threading
 import time
-from typing import Deque, Dict, List, Tuple
+import tty
+from typing import Dict, List, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; used to speed up CSV on big hosts
+    np = None
 
 # ---------- Config & CLI ----------
 
@@ -34,65 +44,363 @@ def parse_args():
 
 # ---------- ANSI Terminal Control ----------
 
+# Pre-encoded UTF-8 fragments used on the render hot path
+VBAR = "│".encode("utf-8")
+HBAR = "─".encode("utf-8")
+DEGREES_C = "°C".encode("utf-8")
+BLOCK = "█".encode("utf-8")
+DOT = "·".encode("utf-8")
+
+# Throttle history is a packed bitfield per GPU: bit 0 is the newest
+# sample, HISTORY_LEN bits retained (see GPUMonitor._render_history)
+HISTORY_LEN = 40
+HISTORY_MASK = (1 << HISTORY_LEN) - 1
+
+# Attribute escape sequences, pre-encoded for the frame builder
+COLOR_RESET = b"\x1b[0m"
+COLOR_BOLD = b"\x1b[1m"
+COLOR_DIM = b"\x1b[2m"
+COLOR_RED = b"\x1b[31m"
+COLOR_GREEN = b"\x1b[32m"
+COLOR_YELLOW = b"\x1b[33m"
+COLOR_CYAN = b"\x1b[36m"
+
+
+class AnsiBuf:
+    """Reusable bytearray builder for frame output.
+
+    Avoids per-segment f-string allocations on the render hot path:
+    escapes and glyphs are appended as pre-encoded bytes, integers are
+    converted digit-by-digit into the buffer. Color is applied through
+    Terminal.paint()/begin()/end() so plain terminals skip it entirely.
+    """
+
+    def __init__(self):
+        self.buf = bytearray()
+
+    def clear(self):
+        self.buf.clear()
+
+    def take(self) -> bytes:
+        """Return the accumulated bytes and reset for the next line"""
+        out = bytes(self.buf)
+        self.buf.clear()
+        return out
+
+    def raw(self, b: bytes):
+        self.buf += b
+
+    def ascii(self, s: str):
+        """Append a known-ASCII str"""
+        self.buf += s.encode("ascii", "replace")
+
+    def int(self, n: int, width: int = 0):
+        """Append integer digits without building an intermediate str"""
+        buf = self.buf
+        digits = bytearray()
+        neg = n < 0
+        if neg:
+            n = -n
+        while True:
+            n, r = divmod(n, 10)
+            digits.append(48 + r)
+            if not n:
+                break
+        if neg:
+            digits.append(45)  # '-'
+        pad = width - len(digits)
+        if pad > 0:
+            buf += b" " * pad
+        digits.reverse()
+        buf += digits
+
+
 class Terminal:
-    """ANSI escape sequence handler for terminal control"""
+    """Terminal control: size tracking, diff rendering and raw output.
+
+    Color handling lives in the subclasses: AnsiTerminal emits escape
+    sequences, PlainTerminal emits nothing, so the render path never
+    branches on a color flag. Instances come from make_terminal().
+    """
+
+    color = False
+
+    # str attributes kept for the (cold) summary path
+    RESET = BOLD = DIM = RED = GREEN = YELLOW = CYAN = ""
 
     def __init__(self):
-        self.color = sys.stdout.isatty() and os.environ.get("TERM", "") not in ("dumb", "")
+        # Previous frame for line diffing
+        self._prev_lines: List[bytes] = []
 
-        # Colors
-        self.RESET = "\033[0m" if self.color else ""
-        self.BOLD = "\033[1m" if self.color else ""
-        self.DIM = "\033[2m" if self.color else ""
-        self.RED = "\033[31m" if self.color else ""
-        self.GREEN = "\033[32m" if self.color else ""
-        self.YELLOW = "\033[33m" if self.color else ""
-        self.CYAN = "\033[36m" if self.color else ""
+        # On a TTY, emit frames with one os.write() on the raw fd; keep
+        # the buffered stream for pipes/redirects
+        self._fd = None
+        try:
+            if sys.stdout.isatty():
+                self._fd = sys.stdout.fileno()
+        except (OSError, ValueError):
+            self._fd = None
 
         # Get terminal size
+        self.width = 0
+        self.height = 0
         self.update_size()
 
     def update_size(self):
         """Update terminal dimensions"""
         size = shutil.get_terminal_size((80, 24))
+        if (size.columns, size.lines) != (self.width, self.height):
+            # Force a full redraw after a resize
+            self._prev_lines = []
         self.width = size.columns
         self.height = size.lines
 
+    def _write(self, data: bytes):
+        """Emit bytes in as few syscalls as the TTY allows"""
+        if self._fd is not None:
+            # os.write may transfer only part of the buffer, e.g. when a
+            # signal handler interrupts a blocked write; loop until
+            # drained so the line diff stays in sync with the screen
+            while data:
+                data = data[os.write(self._fd, data):]
+        else:
+            sys.stdout.buffer.write(data)
+            sys.stdout.buffer.flush()
+
     def clear_screen(self):
         """Clear entire screen and move cursor to home"""
-        sys.stdout.write("\033[2J\033[H")
+        self._prev_lines = []
+        self._write(b"\x1b[2J\x1b[H")
+
+    def render_frame(self, lines: List[bytes]):
+        """Redraw only the lines that changed since the previous frame.
+
+        Emits cursor-home, then for each changed line a move-to-row plus
+        the new content and an erase-to-end-of-line; finally clears any
+        leftover rows from a taller previous frame. Cuts terminal byte
+        traffic to near zero on idle frames.
+        """
+        prev = self._prev_lines
+        out = bytearray(b"\x1b[H")
+        for i, line in enumerate(lines):
+            if i >= len(prev) or prev[i] != line:
+                out += b"\x1b[%d;1H" % (i + 1)
+                out += line
+                out += b"\x1b[K"
+        if len(prev) > len(lines):
+            out += b"\x1b[%d;1H\x1b[J" % (len(lines) + 1)
+        self._prev_lines = lines
+        self._write(bytes(out))
 
     def hide_cursor(self):
         """Hide cursor"""
-        sys.stdout.write("\033[?25l")
+        self._write(b"\x1b[?25l")
 
     def show_cursor(self):
         """Show cursor"""
-        sys.stdout.write("\033[?25h")
+        self._write(b"\x1b[?25h")
+
+    def enter_cbreak(self):
+        """Put stdin into cbreak mode so single keystrokes arrive
+        without waiting for a newline; undone by exit_cbreak()"""
+        self._saved_termios = None
+        try:
+            fd = sys.stdin.fileno()
+            if os.isatty(fd):
+                self._saved_termios = termios.tcgetattr(fd)
+                tty.setcbreak(fd)
+        except (OSError, ValueError, termios.error):
+            self._saved_termios = None
+
+    def exit_cbreak(self):
+        """Restore the stdin settings saved by enter_cbreak()"""
+        if self._saved_termios is None:
+            return
+        try:
+            termios.tcsetattr(sys.stdin.fileno(), termios.TCSADRAIN, self._saved_termios)
+        except (OSError, ValueError, termios.error):
+            pass
+        self._saved_termios = None
+
+    # Color application hooks, overridden by AnsiTerminal
+    def paint(self, buf: AnsiBuf, attr: bytes, payload: bytes):
+        """Append payload wrapped in attr + reset (plain: payload only)"""
+        buf.raw(payload)
+
+    def begin(self, buf: AnsiBuf, attr: bytes):
+        """Start an attribute run for a composite segment"""
+
+    def end(self, buf: AnsiBuf):
+        """End an attribute run started with begin()"""
+
+
+class AnsiTerminal(Terminal):
+    """Terminal with ANSI color/attribute output"""
+
+    color = True
+
+    RESET = "\033[0m"
+    BOLD = "\033[1m"
+    DIM = "\033[2m"
+    RED = "\033[31m"
+    GREEN = "\033[32m"
+    YELLOW = "\033[33m"
+    CYAN = "\033[36m"
+
+    def paint(self, buf: AnsiBuf, attr: bytes, payload: bytes):
+        buf.raw(attr)
+        buf.raw(payload)
+        buf.raw(COLOR_RESET)
+
+    def begin(self, buf: AnsiBuf, attr: bytes):
+        buf.raw(attr)
+
+    def end(self, buf: AnsiBuf):
+        buf.raw(COLOR_RESET)
+
+
+class PlainTerminal(Terminal):
+    """Colorless terminal (dumb TERM or stdout not a TTY)"""
+
+
+def make_terminal() -> Terminal:
+    """Pick the terminal implementation once at startup"""
+    if sys.stdout.isatty() and os.environ.get("TERM", "") not in ("dumb", ""):
+        return AnsiTerminal()
+    return PlainTerminal()
 
 # ---------- NVML Backend ----------
 
+# Candidate NVML field ids per sampled metric, in preference order. Names
+# vary across driver/pynvml versions, so resolve whichever is available
+# and probe support once at init.
+_FIELD_CANDIDATES = (
+    ("NVML_FI_DEV_POWER_INSTANT", "NVML_FI_DEV_POWER_USAGE"),
+    ("NVML_FI_DEV_CLOCK_SM_CURRENT_FREQUENCY", "NVML_FI_DEV_SM_CLOCK"),
+    ("NVML_FI_DEV_GPU_UTIL",),
+    ("NVML_FI_DEV_CLOCKS_EVENT_REASONS", "NVML_FI_DEV_CLOCKS_THROTTLE_REASONS"),
+    ("NVML_FI_DEV_TEMPERATURE_CURRENT", "NVML_FI_DEV_TEMPERATURE_GPU"),
+)
+
+
 class Backend:
     """Abstracts data collection via NVML or nvidia-smi"""
 
     def __init__(self):
         self.use_nvml = False
         self.nvml = None
+        self.handles: List = []
+        self.names: List[str] = []
+        self.field_ids: List[int] = []
+        self._fn_power = None
+        self._fn_clock = None
+        self._fn_util = None
+        self._fn_temp = None
+        self._fn_reasons = None
+        self._clock_sm = 0
+        self._temp_gpu = 0
+        self._nvml_error = Exception
+        self._has_power = False
+        self._has_temp = False
         self._init_backend()
 
     def _init_backend(self):
         try:
             import pynvml as nvml
             nvml.nvmlInit()
+            # Resolve device handles once; nvmlDeviceGetHandleByIndex on
+            # every sample is a known NVML hotspot.
+            count = nvml.nvmlDeviceGetCount()
+            self.handles = [nvml.nvmlDeviceGetHandleByIndex(i) for i in range(count)]
+            self.names = []
+            for h in self.handles:
+                name = nvml.nvmlDeviceGetName(h)
+                if isinstance(name, bytes):
+                    name = name.decode("utf-8", "ignore")
+                self.names.append(name)
+            # Resolve NVML bindings and constants once; sample() then
+            # works from bound locals instead of per-call module
+            # attribute lookups
+            self._fn_power = nvml.nvmlDeviceGetPowerUsage
+            self._fn_clock = nvml.nvmlDeviceGetClockInfo
+            self._fn_util = nvml.nvmlDeviceGetUtilizationRates
+            self._fn_temp = nvml.nvmlDeviceGetTemperature
+            self._clock_sm = nvml.NVML_CLOCK_SM
+            self._temp_gpu = nvml.NVML_TEMPERATURE_GPU
+            self._fn_reasons = getattr(
+                nvml, "nvmlDeviceGetCurrentClocksEventReasons",
+                getattr(nvml, "nvmlDeviceGetCurrentClocksThrottleReasons", None))
+            # Catch only NVML errors from here on: a bare except would
+            # also swallow KeyboardInterrupt/SystemExit
+            self._nvml_error = getattr(nvml, "NVMLError", Exception)
+
+            # Probe optional features once so the sampling loop branches
+            # on plain bools instead of paying exception setup per call
+            if self.handles:
+                h = self.handles[0]
+                self._has_power = self._probe(self._fn_power, h)
+                self._has_temp = self._probe(self._fn_temp, h, nvml.NVML_TEMPERATURE_GPU)
+                if self._fn_reasons is not None and not self._probe(self._fn_reasons, h):
+                    self._fn_reasons = None
+
             self.nvml = nvml
             self.use_nvml = True
+            self.field_ids = self._probe_field_values(nvml)
         except Exception:
             self.use_nvml = False
             self.nvml = None
+            self.handles = []
+            self.names = []
+            self.field_ids = []
+
+    def _probe(self, fn, *args) -> bool:
+        """Check once whether an NVML call is supported on this driver"""
+        try:
+            fn(*args)
+            return True
+        except self._nvml_error:
+            return False
+
+    def _probe_field_values(self, nvml) -> List[int]:
+        """
+        Discover once whether the driver supports fetching all sampled
+        metrics through nvmlDeviceGetFieldValues (one round-trip instead
+        of five calls per GPU). Returns the field-id vector, or [] to
+        fall back to per-metric calls.
+        """
+        if not self.handles or not hasattr(nvml, "nvmlDeviceGetFieldValues"):
+            return []
+        field_ids = []
+        for candidates in _FIELD_CANDIDATES:
+            fid = next((getattr(nvml, n) for n in candidates if hasattr(nvml, n)), None)
+            if fid is None:
+                return []
+            field_ids.append(fid)
+        try:
+            values = nvml.nvmlDeviceGetFieldValues(self.handles[0], field_ids)
+            if any(v.nvmlReturn != nvml.NVML_SUCCESS for v in values):
+                return []
+        except Exception:
+            return []
+        return field_ids
+
+    def _field_value(self, v) -> float:
+        """Extract the numeric payload from a c_nvmlFieldValue_t"""
+        vt = v.valueType
+        nv = self.nvml
+        if vt == nv.NVML_VALUE_TYPE_DOUBLE:
+            return v.value.dVal
+        if vt == nv.NVML_VALUE_TYPE_UNSIGNED_INT:
+            return v.value.uiVal
+        if vt == nv.NVML_VALUE_TYPE_UNSIGNED_LONG:
+            return v.value.ulVal
+        if vt == nv.NVML_VALUE_TYPE_UNSIGNED_LONG_LONG:
+            return v.value.ullVal
+        return v.value.sllVal
 
     def device_count(self) -> int:
         if self.use_nvml:
-            return self.nvml.nvmlDeviceGetCount()
+            return len(self.handles)
         out = subprocess.check_output(
             ["nvidia-smi", "--query-gpu=index", "--format=csv,noheader"], text=True
         ).strip().splitlines()
@@ -100,11 +408,7 @@ class Backend:
 
     def name(self, idx: int) -> str:
         if self.use_nvml:
-            h = self.nvml.nvmlDeviceGetHandleByIndex(idx)
-            name = self.nvml.nvmlDeviceGetName(h)
-            if isinstance(name, bytes):
-                return name.decode("utf-8", "ignore")
-            return name
+            return self.names[idx]
         out = subprocess.check_output(
             ["nvidia-smi", f"--id={idx}", "--query-gpu=name", "--format=csv,noheader"], text=True
         )
@@ -116,34 +420,22 @@ class Backend:
         """
         if self.use_nvml:
             nv = self.nvml
-            h = nv.nvmlDeviceGetHandleByIndex(idx)
-
-            # Power
-            try:
-                p_mw = nv.nvmlDeviceGetPowerUsage(h)
-            except:
-                p_mw = 0
-            power_w = p_mw / 1000.0
-
-            # Clocks and utilization
-            sm = nv.nvmlDeviceGetClockInfo(h, nv.NVML_CLOCK_SM)
-            util = nv.nvmlDeviceGetUtilizationRates(h).gpu
-
-            # Temperature
-            try:
-                temp = nv.nvmlDeviceGetTemperature(h, nv.NVML_TEMPERATURE_GPU)
-            except:
-                temp = 0
-
-            # Throttle reasons
-            mask = 0
-            try:
-                mask = nv.nvmlDeviceGetCurrentClocksEventReasons(h)
-            except:
-                try:
-                    mask = nv.nvmlDeviceGetCurrentClocksThrottleReasons(h)
-                except:
-                    mask = 0
+            h = self.handles[idx]
+
+            if self.field_ids:
+                # One batched driver round-trip for all five metrics;
+                # support was verified at init so no per-call guard here.
+                values = nv.nvmlDeviceGetFieldValues(h, self.field_ids)
+                p_mw, sm, util, mask, temp = (self._field_value(v) for v in values)
+                return (p_mw / 1000.0, int(sm), int(util), int(mask), float(temp))
+
+            # Support for the optional metrics was probed at init, so no
+            # per-call exception handling is needed here
+            power_w = self._fn_power(h) / 1000.0 if self._has_power else 0.0
+            sm = self._fn_clock(h, self._clock_sm)
+            util = self._fn_util(h).gpu
+            temp = self._fn_temp(h, self._temp_gpu) if self._has_temp else 0
+            mask = self._fn_reasons(h) if self._fn_reasons is not None else 0
 
             return (power_w, sm, util, int(mask), float(temp))
 
@@ -154,6 +446,27 @@ class Backend:
             "--format=csv,noheader,nounits"
         ]
         line = subprocess.check_output(cmd, text=True).strip()
+        return self._parse_smi_line(line)
+
+    def sample_all(self) -> List[Tuple[float, int, int, int, float]]:
+        """
+        Sample every GPU in one pass. In nvidia-smi mode this issues a
+        single subprocess call for all GPUs instead of one fork per GPU.
+        Returns a list indexed by GPU index.
+        """
+        if self.use_nvml:
+            return [self.sample(i) for i in range(len(self.handles))]
+
+        cmd = [
+            "nvidia-smi",
+            "--query-gpu=power.draw,clocks.current.sm,utilization.gpu,clocks_throttle_reasons.active,temperature.gpu",
+            "--format=csv,noheader,nounits"
+        ]
+        out = subprocess.check_output(cmd, text=True).strip()
+        return [self._parse_smi_line(line) for line in out.splitlines()]
+
+    @staticmethod
+    def _parse_smi_line(line: str) -> Tuple[float, int, int, int, float]:
         parts = [x.strip() for x in line.split(",")]
         power_w = float(parts[0]) if parts[0] else 0.0
         sm = int(parts[1]) if parts[1] else 0
@@ -166,15 +479,78 @@ class Backend:
         if self.use_nvml and self.nvml:
             try:
                 self.nvml.nvmlShutdown()
-            except:
+            except self._nvml_error:
                 pass
 
 # ---------- Main Monitor ----------
 
+# How often the CSV log is flushed to disk (seconds)
+CSV_FLUSH_INTERVAL = 5.0
+
+# Sampling cadence floors when nobody is watching: stdout redirected to
+# a pipe/file, or the process stopped/backgrounded with Ctrl-Z
+NONINTERACTIVE_INTERVAL = 5.0
+SUSPENDED_INTERVAL = 60.0
+
+# Mask bits that drive the problem text; the cache below is keyed on them
+_PROBLEM_BITS = 0x00EC
+
+
+@functools.lru_cache(maxsize=64)
+def _describe_problems(mask_bits: int) -> str:
+    """Build the problem description for a (pre-masked) reasons mask.
+
+    Cached: the mask takes only a handful of distinct values in practice,
+    so after warmup every sample and CSV row gets the string for free.
+    """
+    problems = []
+
+    if mask_bits & 0x0080:  # HW Power Brake
+        problems.append("POWER LIMIT: GPU wants more power but is limited by power delivery")
+    if mask_bits & 0x0040:  # HW Thermal
+        problems.append("OVERHEATING: Hardware thermal protection activated")
+    if mask_bits & 0x0020:  # SW Thermal
+        problems.append("HOT: Driver thermal throttling")
+    if mask_bits & 0x0004:  # SW Power Cap
+        problems.append("CAPPED: Software power limit reached")
+    if mask_bits & 0x0008:  # HW Slowdown
+        problems.append("THROTTLED: General hardware slowdown")
+
+    if not problems:
+        return "OK: No throttling"
+
+    return " | ".join(problems)
+
+
+# Summary advice per throttle bit: (bit, color attribute, headline,
+# problem text, suggested fix). Iterated in severity order.
+_SUMMARY_CHECKS = (
+    (0x0080, "RED", "✗ POWER BRAKE ACTIVE",
+     "GPU needs more power than available",
+     "Check PSU capacity, PCIe power cables, or increase power limit"),
+    (0x0040, "RED", "✗ THERMAL THROTTLING",
+     "GPU is overheating (currently {temp:.0f}°C)",
+     "Improve cooling, check thermal paste, increase fan speed"),
+    (0x0020, "YELLOW", "⚠ SOFTWARE THERMAL LIMIT",
+     "Driver is limiting performance due to temperature",
+     "Improve airflow, reduce ambient temperature"),
+    (0x0004, "YELLOW", "⚠ POWER CAP",
+     "Software power limit is restricting performance",
+     "Use 'sudo nvidia-smi -pl <watts>' to increase limit"),
+)
+
+
 class GPUMonitor:
     def __init__(self, args):
         self.args = args
-        self.term = Terminal()
+
+        # A redirected stdout has no viewer: slow the cadence down,
+        # unless CSV logging is on and regular rows matter
+        if not sys.stdout.isatty() and not args.csv:
+            args.interval = max(args.interval, NONINTERACTIVE_INTERVAL)
+
+        self.term = make_terminal()
+        self.buf = AnsiBuf()
         self.backend = Backend()
 
         # Get GPU info
@@ -192,172 +568,421 @@ class GPUMonitor:
 
         self.gpu_names = {i: self.backend.name(i) for i in self.gpu_indices}
 
-        # Initialize histories for graphs (last 40 samples)
-        self.histories = {i: collections.deque(maxlen=40) for i in self.gpu_indices}
+        # Throttle histories: one packed HISTORY_LEN-bit int per GPU
+        # (bit 0 = newest sample) plus a shared valid-sample count
+        self.histories: Dict[int, int] = {i: 0 for i in self.gpu_indices}
+        self._history_len = 0
 
-        # CSV logging
+        # CSV logging: block-buffered, flushed every CSV_FLUSH_INTERVAL
+        # seconds instead of one write() syscall per row
         self.csvf = None
+        self._last_csv_flush = time.time()
         if args.csv:
-            self.csvf = open(args.csv, "w", buffering=1)
+            self.csvf = open(args.csv, "w")
             header = ["timestamp", "gpu", "power_w", "sm_mhz", "util_pct", "temp_c", "mask_hex", "problems"]
             self.csvf.write(",".join(header) + "\n")
 
+        # On many-GPU hosts, batch the numeric CSV formatting through
+        # numpy (when installed) instead of per-field f-strings
+        self._row_buf = None
+        self._row_masks = None
+        self._csv_pos: Dict[int, int] = {}
+        if self.csvf and np is not None and len(self.gpu_indices) >= 4:
+            self._row_buf = np.zeros((len(self.gpu_indices), 4), dtype=np.float64)
+            self._row_masks = [0] * len(self.gpu_indices)
+            self._csv_pos = {i: j for j, i in enumerate(self.gpu_indices)}
+
+        # Specialized normal-mode frame builder for this GPU topology
+        self._render_lines = self._compile_render_lines()
+
         self.start_time = time.time()
         self.stop_flag = False
 
-        # Set up signal handler
+        # Watch stdin for keystrokes only when it is an interactive TTY
+        self._watch_stdin = sys.stdin.isatty()
+
+        # Wakes the sampler early on resume and on shutdown so neither
+        # has to wait out a full sleep
+        self._wake = threading.Event()
+
+        # Latest-snapshot slot shared with the sampler thread
+        self._lock = threading.Lock()
+        self._snapshot = None
+        self._sample_error = None
+        self._last_sample_ts = 0.0
+        self._last_per_gpu: Dict[int, Tuple[float, int, int, int, float]] = {}
+
+        # Set up signal handlers
         signal.signal(signal.SIGINT, self._signal_handler)
 
+        # Re-read the terminal size only on actual resize instead of
+        # running an ioctl every frame (not available on Windows)
+        if hasattr(signal, "SIGWINCH"):
+            signal.signal(signal.SIGWINCH, lambda *_: self.term.update_size())
+
+        # Drop to a once-per-minute cadence while stopped/backgrounded
+        self._suspended = False
+        if hasattr(signal, "SIGTSTP") and hasattr(signal, "SIGCONT"):
+            signal.signal(signal.SIGTSTP, self._tstp_handler)
+            signal.signal(signal.SIGCONT, self._cont_handler)
+
     def _signal_handler(self, sig, frame):
         """Handle Ctrl+C gracefully"""
         self.stop_flag = True
+        self._wake.set()
+
+    def _tstp_handler(self, sig, frame):
+        """Ctrl-Z: mark sampling suspended, then actually stop"""
+        self._suspended = True
+        os.kill(os.getpid(), signal.SIGSTOP)
+
+    def _cont_handler(self, sig, frame):
+        """Resumed: full cadence only once we are back in the foreground"""
+        self._suspended = not self._is_foreground()
+        self._wake.set()
+        # The shell wrote over our display while we were stopped; the
+        # diffed previous frame no longer matches the screen, so force a
+        # full repaint
+        self.term.clear_screen()
+        self.term.hide_cursor()
+
+    @staticmethod
+    def _is_foreground() -> bool:
+        """Whether we own the controlling terminal's foreground group.
+
+        Checked against stdin or /dev/tty rather than stdout: with
+        stdout redirected (e.g. --csv with output piped away) there is
+        still a controlling terminal, and treating that case as
+        backgrounded would wrongly pin the monitor at the suspended
+        cadence after a single Ctrl-Z/fg cycle.
+        """
+        try:
+            return os.tcgetpgrp(sys.stdin.fileno()) == os.getpgrp()
+        except (OSError, ValueError):
+            pass
+        try:
+            fd = os.open("/dev/tty", os.O_RDONLY)
+        except OSError:
+            # No controlling terminal at all: never treat as backgrounded
+            return True
+        try:
+            return os.tcgetpgrp(fd) == os.getpgrp()
+        except OSError:
+            return True
+        finally:
+            os.close(fd)
 
     def get_problem_description(self, mask: int) -> str:
         """Get human-readable problem description"""
-        problems = []
-
-        if mask & 0x0080:  # HW Power Brake
-            problems.append("POWER LIMIT: GPU wants more power but is limited by power delivery")
-        if mask & 0x0040:  # HW Thermal
-            problems.append("OVERHEATING: Hardware thermal protection activated")
-        if mask & 0x0020:  # SW Thermal
-            problems.append("HOT: Driver thermal throttling")
-        if mask & 0x0004:  # SW Power Cap
-            problems.append("CAPPED: Software power limit reached")
-        if mask & 0x0008:  # HW Slowdown
-            problems.append("THROTTLED: General hardware slowdown")
+        return _describe_problems(mask & _PROBLEM_BITS)
+
+    def _render_history(self, buf: AnsiBuf, hist: int, n: int) -> None:
+        """Append the newest n history bits (oldest first), coalescing
+        consecutive same-state cells so each run costs one color
+        sequence at most"""
+        if not hist & ((1 << n) - 1):
+            # Common case: nothing throttled in the window
+            buf.raw(DOT * n)
+            return
+        bits = ((hist >> k) & 1 for k in range(n - 1, -1, -1))
+        for bit, run in itertools.groupby(bits):
+            count = sum(1 for _ in run)
+            if bit:
+                self.term.paint(buf, COLOR_RED, BLOCK * count)
+            else:
+                buf.raw(DOT * count)
+
+    def _sampler_loop(self):
+        """Background thread: sample all GPUs and publish a snapshot"""
+        while not self.stop_flag:
+            try:
+                samples = self.backend.sample_all()
+            except Exception as e:
+                self._sample_error = e
+                self.stop_flag = True
+                break
+            with self._lock:
+                self._snapshot = (time.time(), samples)
+            # Event-based sleep: SIGCONT and shutdown set the event, so
+            # resume takes effect within one tick instead of waiting out
+            # the suspended interval
+            self._wake.wait(SUSPENDED_INTERVAL if self._suspended else self.args.interval)
+            self._wake.clear()
+
+    def _compile_render_lines(self):
+        """Generate an unrolled normal-mode frame builder for this run's
+        fixed GPU topology.
+
+        The GPU list never changes mid-run, so the per-GPU loop, index
+        formatting and per-iteration dict lookups can be baked out with
+        exec() at startup. Returns a bound method; on any failure the
+        generic _build_normal_lines is used instead.
+        """
+        try:
+            backend_label = " NVML" if self.backend.use_nvml else " nvidia-smi"
+            src = [
+                "def _render(self, per_gpu, uptime):",
+                "    buf = self.buf",
+                "    term = self.term",
+                "    lines = []",
+                "    term.paint(buf, COLOR_BOLD, b'GPU Throttle Monitor')",
+                "    buf.raw(b' '); buf.raw(VBAR)",
+                "    buf.ascii(f' Uptime: {uptime:.1f}s ')",
+                "    buf.raw(VBAR)",
+                f"    buf.raw({backend_label.encode('ascii')!r})",
+                "    lines.append(buf.take())",
+                "    lines.append(HBAR * min(term.width, 120))",
+            ]
+            for i in self.gpu_indices:
+                src += [
+                    f"    power_w, sm, util, mask, temp = per_gpu[{i}]",
+                    f"    term.begin(buf, COLOR_CYAN); buf.raw({b'GPU%d' % i!r}); term.end(buf)",
+                    "    buf.ascii(f': {power_w:5.1f}W ')",
+                    "    buf.raw(VBAR); buf.raw(b' ')",
+                    "    buf.int(sm, 4); buf.ascii('MHz '); buf.raw(VBAR); buf.raw(b' ')",
+                    "    buf.int(util, 3); buf.ascii('% '); buf.raw(VBAR); buf.raw(b' ')",
+                    "    buf.ascii(f'{temp:3.0f}'); buf.raw(DEGREES_C)",
+                    "    if temp > 80:",
+                    "        buf.raw(b' '); term.paint(buf, COLOR_RED, b'[OVERHEATING]')",
+                    "    elif temp > 70:",
+                    "        buf.raw(b' '); term.paint(buf, COLOR_YELLOW, b'[HOT]')",
+                    "    lines.append(buf.take())",
+                    "    buf.ascii('  History: ')",
+                    "    buf.raw(DOT * (HISTORY_LEN - self._history_len))",
+                    f"    self._render_history(buf, self.histories[{i}], self._history_len)",
+                    "    lines.append(buf.take())",
+                    "    problem = self.get_problem_description(mask)",
+                    "    buf.ascii('  Status: ')",
+                    "    if 'OK:' in problem:",
+                    "        attr = COLOR_GREEN",
+                    "    elif 'POWER LIMIT' in problem or 'OVERHEATING' in problem:",
+                    "        attr = COLOR_RED",
+                    "    elif 'HOT' in problem or 'CAPPED' in problem:",
+                    "        attr = COLOR_YELLOW",
+                    "    else:",
+                    "        attr = None",
+                    "    if attr is not None:",
+                    "        term.paint(buf, attr, problem.encode('ascii', 'replace'))",
+                    "    else:",
+                    "        buf.ascii(problem)",
+                    "    lines.append(buf.take())",
+                    "    lines.append(b'')",
+                ]
+            src.append("    return lines")
+            namespace = {}
+            exec(compile("\n".join(src), "<nvmonitor-render>", "exec"), globals(), namespace)
+            return namespace["_render"].__get__(self)
+        except Exception:
+            return self._build_normal_lines
 
-        if not problems:
-            return "OK: No throttling"
+    def _format_csv_rows_np(self, now: float) -> str:
+        """Format the tick's CSV rows with vectorized numpy conversion.
 
-        return " | ".join(problems)
+        All numeric columns are converted in four array operations
+        instead of per-field f-strings per GPU.
+        """
+        ts = dt.datetime.fromtimestamp(now).isoformat(timespec="milliseconds")
+        buf = self._row_buf
+        power_s = np.char.mod("%.2f", buf[:, 0])
+        sm_s = np.char.mod("%d", buf[:, 1].astype(np.int64))
+        util_s = np.char.mod("%d", buf[:, 2].astype(np.int64))
+        temp_s = np.char.mod("%.1f", buf[:, 3])
+        rows = []
+        for j, i in enumerate(self.gpu_indices):
+            mask = self._row_masks[j]
+            rows.append(",".join((
+                ts, str(i), power_s[j], sm_s[j], util_s[j], temp_s[j],
+                f"0x{mask:016x}", self.get_problem_description(mask)
+            )) + "\n")
+        return "".join(rows)
 
     def update_display(self):
-        """Update the terminal display"""
-        now = time.time()
-        self.term.update_size()
+        """Update the terminal display from the latest snapshot"""
+        # Grab the latest snapshot published by the sampler thread
+        with self._lock:
+            snapshot = self._snapshot
+        if snapshot is None:
+            return
+        now, samples = snapshot
+
+        # History and CSV only advance when a fresh sample arrived
+        new_sample = now != self._last_sample_ts
+        self._last_sample_ts = now
 
-        # Collect samples
         per_gpu = {}
+        csv_rows = []
+
+        # The timestamp is identical for every row in a tick: format once
+        csv_ts = ""
+        if self.csvf and new_sample and self._row_buf is None:
+            csv_ts = dt.datetime.fromtimestamp(now).isoformat(timespec="milliseconds")
+
         for i in self.gpu_indices:
-            data = self.backend.sample(i)
+            data = samples[i]
             per_gpu[i] = data
 
-            # Update history for graphs
+            if not new_sample:
+                continue
+
+            # Update history for graphs: shift in the new throttled bit
             power_w, sm, util, mask, temp = data
-            # Store if throttled (1) or not (0)
             is_throttled = 1 if (mask & 0x00E8) else 0  # Check all throttle bits
-            self.histories[i].append(is_throttled)
+            self.histories[i] = ((self.histories[i] << 1) | is_throttled) & HISTORY_MASK
 
             # CSV logging
             if self.csvf:
                 power_w, sm, util, mask, temp = data
+                if self._row_buf is not None:
+                    # Stash numerics; formatted in bulk after the loop
+                    j = self._csv_pos[i]
+                    self._row_buf[j] = (power_w, sm, util, temp)
+                    self._row_masks[j] = mask
+                    continue
                 problems = self.get_problem_description(mask)
                 fields = [
-                    dt.datetime.fromtimestamp(now).isoformat(timespec="milliseconds"),
+                    csv_ts,
                     str(i), f"{power_w:.2f}", str(sm), str(util),
                     f"{temp:.1f}", f"0x{mask:016x}", problems
                 ]
-                self.csvf.write(",".join(fields) + "\n")
+                csv_rows.append(",".join(fields) + "\n")
 
-        # Clear screen
-        self.term.clear_screen()
+        # Keep the freshest samples around for the shutdown summary
+        self._last_per_gpu = per_gpu
+
+        if new_sample and self._row_buf is not None:
+            csv_rows.append(self._format_csv_rows_np(now))
+
+        if new_sample:
+            self._history_len = min(self._history_len + 1, HISTORY_LEN)
+
+        # One write per tick, flushed periodically rather than per row
+        if csv_rows:
+            self.csvf.write("".join(csv_rows))
+            if now - self._last_csv_flush > CSV_FLUSH_INTERVAL:
+                self.csvf.flush()
+                self._last_csv_flush = now
+
+        # Build the frame as a list of pre-encoded byte lines
+        self.buf.clear()
 
         # Check if we have enough space - compact mode if too small
         needed_lines = len(self.gpu_indices) * 4 + 3  # 4 lines per GPU + header
         compact_mode = self.term.height < needed_lines
 
-        # Header
         uptime = now - self.start_time
-
         if compact_mode:
-            # Ultra compact for small terminals
-            print(f"{self.term.BOLD}GPU Monitor{self.term.RESET} [{uptime:.0f}s] {self.term.RED}[COMPACT MODE - Terminal too small]{self.term.RESET}")
-
-            for i in self.gpu_indices:
-                power_w, sm, util, mask, temp = per_gpu[i]
-
-                # Build mini graph (last 20 samples)
-                mini_graph = ""
-                history_slice = list(self.histories[i])[-20:]
-                for val in history_slice:
-                    if val:
-                        mini_graph += f"{self.term.RED}█{self.term.RESET}"
-                    else:
-                        mini_graph += "·"
-                # Pad if needed
-                pad = 20 - len(history_slice)
-                mini_graph = "·" * pad + mini_graph
-
-                # Single line per GPU
-                line = f"{self.term.CYAN}GPU{i}{self.term.RESET}: {power_w:3.0f}W {sm:4d}MHz {temp:2.0f}°C {mini_graph}"
-
-                # Add problem codes
-                if mask & 0x0080:
-                    line += f" {self.term.RED}PWR{self.term.RESET}"
-                elif mask & 0x0040:
-                    line += f" {self.term.RED}THM{self.term.RESET}"
-                elif mask & 0x0020:
-                    line += f" {self.term.YELLOW}HOT{self.term.RESET}"
-                elif mask & 0x0004:
-                    line += f" {self.term.YELLOW}CAP{self.term.RESET}"
-
-                print(line)
+            lines = self._build_compact_lines(per_gpu, uptime)
         else:
-            # Normal display
-            print(f"{self.term.BOLD}GPU Throttle Monitor{self.term.RESET} │ "
-                  f"Uptime: {uptime:.1f}s │ "
-                  f"{'NVML' if self.backend.use_nvml else 'nvidia-smi'}")
-            print("─" * min(self.term.width, 120))
-
-            # Display each GPU
-            for i in self.gpu_indices:
-                power_w, sm, util, mask, temp = per_gpu[i]
-
-                # GPU status line
-                status = f"{self.term.CYAN}GPU{i}{self.term.RESET}: "
-                status += f"{power_w:5.1f}W │ {sm:4d}MHz │ {util:3d}% │ {temp:3.0f}°C"
-
-                # Temperature warning
-                if temp > 80:
-                    status += f" {self.term.RED}[OVERHEATING]{self.term.RESET}"
-                elif temp > 70:
-                    status += f" {self.term.YELLOW}[HOT]{self.term.RESET}"
-
-                print(status)
-
-                # Throttle graph - show history
-                graph = ""
-                for val in self.histories[i]:
-                    if val:
-                        graph += f"{self.term.RED}█{self.term.RESET}"  # Red block for throttled
-                    else:
-                        graph += "·"  # Dot for OK
-
-                # Pad graph if not full
-                pad = 40 - len(self.histories[i])
-                graph = "·" * pad + graph
-
-                print(f"  History: {graph}")
-
-                # Problem description - ALWAYS shown
-                problem = self.get_problem_description(mask)
-                if "OK:" in problem:
-                    print(f"  Status: {self.term.GREEN}{problem}{self.term.RESET}")
-                elif "POWER LIMIT" in problem or "OVERHEATING" in problem:
-                    print(f"  Status: {self.term.RED}{problem}{self.term.RESET}")
-                elif "HOT" in problem or "CAPPED" in problem:
-                    print(f"  Status: {self.term.YELLOW}{problem}{self.term.RESET}")
-                else:
-                    print(f"  Status: {problem}")
-
-                print()  # Blank line between GPUs
+            lines = self._render_lines(per_gpu, uptime)
 
         # Footer
-        print("─" * min(self.term.width, 120))
-        print(f"{self.term.DIM}Press Ctrl+C to exit{self.term.RESET}")
+        lines.append(HBAR * min(self.term.width, 120))
+        self.term.paint(self.buf, COLOR_DIM, b"Press q or Ctrl+C to exit")
+        lines.append(self.buf.take())
 
-        sys.stdout.flush()
+        self.term.render_frame(lines)
+
+    def _build_compact_lines(self, per_gpu, uptime: float) -> List[bytes]:
+        """Ultra compact frame for small terminals: one line per GPU"""
+        buf = self.buf
+        term = self.term
+        lines: List[bytes] = []
+
+        # Header
+        term.paint(buf, COLOR_BOLD, b"GPU Monitor")
+        buf.ascii(f" [{uptime:.0f}s] ")
+        term.paint(buf, COLOR_RED, b"[COMPACT MODE - Terminal too small]")
+        lines.append(buf.take())
+
+        for i in self.gpu_indices:
+            power_w, sm, util, mask, temp = per_gpu[i]
+
+            # Single line per GPU
+            term.begin(buf, COLOR_CYAN); buf.ascii("GPU"); buf.int(i); term.end(buf)
+            buf.ascii(f": {power_w:3.0f}W ")
+            buf.int(sm, 4); buf.ascii("MHz ")
+            buf.ascii(f"{temp:2.0f}"); buf.raw(DEGREES_C); buf.raw(b" ")
+
+            # Mini graph (last 20 samples), padded on the left
+            n = min(self._history_len, 20)
+            buf.raw(DOT * (20 - n))
+            self._render_history(buf, self.histories[i], n)
+
+            # Add problem codes
+            if mask & 0x0080:
+                buf.raw(b" "); term.paint(buf, COLOR_RED, b"PWR")
+            elif mask & 0x0040:
+                buf.raw(b" "); term.paint(buf, COLOR_RED, b"THM")
+            elif mask & 0x0020:
+                buf.raw(b" "); term.paint(buf, COLOR_YELLOW, b"HOT")
+            elif mask & 0x0004:
+                buf.raw(b" "); term.paint(buf, COLOR_YELLOW, b"CAP")
+
+            lines.append(buf.take())
+
+        return lines
+
+    def _build_normal_lines(self, per_gpu, uptime: float) -> List[bytes]:
+        """Normal frame: header plus a four-line block per GPU"""
+        buf = self.buf
+        term = self.term
+        lines: List[bytes] = []
+
+        # Header
+        term.paint(buf, COLOR_BOLD, b"GPU Throttle Monitor")
+        buf.raw(b" "); buf.raw(VBAR)
+        buf.ascii(f" Uptime: {uptime:.1f}s ")
+        buf.raw(VBAR)
+        buf.ascii(" NVML" if self.backend.use_nvml else " nvidia-smi")
+        lines.append(buf.take())
+        lines.append(HBAR * min(self.term.width, 120))
+
+        # Display each GPU
+        for i in self.gpu_indices:
+            power_w, sm, util, mask, temp = per_gpu[i]
+
+            # GPU status line
+            term.begin(buf, COLOR_CYAN); buf.ascii("GPU"); buf.int(i); term.end(buf)
+            buf.ascii(f": {power_w:5.1f}W ")
+            buf.raw(VBAR); buf.raw(b" ")
+            buf.int(sm, 4); buf.ascii("MHz "); buf.raw(VBAR); buf.raw(b" ")
+            buf.int(util, 3); buf.ascii("% "); buf.raw(VBAR); buf.raw(b" ")
+            buf.ascii(f"{temp:3.0f}"); buf.raw(DEGREES_C)
+
+            # Temperature warning
+            if temp > 80:
+                buf.raw(b" "); term.paint(buf, COLOR_RED, b"[OVERHEATING]")
+            elif temp > 70:
+                buf.raw(b" "); term.paint(buf, COLOR_YELLOW, b"[HOT]")
+
+            lines.append(buf.take())
+
+            # Throttle graph - show history, padded to full width
+            buf.ascii("  History: ")
+            buf.raw(DOT * (HISTORY_LEN - self._history_len))
+            self._render_history(buf, self.histories[i], self._history_len)
+            lines.append(buf.take())
+
+            # Problem description - ALWAYS shown
+            problem = self.get_problem_description(mask)
+            buf.ascii("  Status: ")
+            if "OK:" in problem:
+                attr = COLOR_GREEN
+            elif "POWER LIMIT" in problem or "OVERHEATING" in problem:
+                attr = COLOR_RED
+            elif "HOT" in problem or "CAPPED" in problem:
+                attr = COLOR_YELLOW
+            else:
+                attr = None
+            if attr is not None:
+                term.paint(buf, attr, problem.encode("ascii", "replace"))
+            else:
+                buf.ascii(problem)
+            lines.append(buf.take())
+
+            lines.append(b"")  # Blank line between GPUs
+
+        return lines
 
     def show_summary(self):
         """Show run summary with problem analysis"""
@@ -368,47 +993,23 @@ class GPUMonitor:
         print(f"{self.term.BOLD}PROBLEM ANALYSIS:{self.term.RESET}")
         print()
 
-        # Analyze each GPU's last state
-        for i in self.gpu_indices:
-            try:
-                data = self.backend.sample(i)
-            except:
-                # NVML may be closed, skip
-                continue
+        # Analyze each GPU's last sampled state (no fresh driver calls:
+        # the backend may already be closed at this point)
+        for i, data in self._last_per_gpu.items():
             power_w, sm, util, mask, temp = data
 
             print(f"{self.term.CYAN}GPU{i} [{self.gpu_names[i]}]{self.term.RESET}")
 
             problems_found = False
 
-            # Critical problems
-            if mask & 0x0080:
-                problems_found = True
-                print(f"  {self.term.RED}✗ POWER BRAKE ACTIVE{self.term.RESET}")
-                print(f"    Problem: GPU needs more power than available")
-                print(f"    Solution: Check PSU capacity, PCIe power cables, or increase power limit")
-                print()
-
-            if mask & 0x0040:
-                problems_found = True
-                print(f"  {self.term.RED}✗ THERMAL THROTTLING{self.term.RESET}")
-                print(f"    Problem: GPU is overheating (currently {temp:.0f}°C)")
-                print(f"    Solution: Improve cooling, check thermal paste, increase fan speed")
-                print()
-
-            # Warnings
-            if mask & 0x0020:
-                problems_found = True
-                print(f"  {self.term.YELLOW}⚠ SOFTWARE THERMAL LIMIT{self.term.RESET}")
-                print(f"    Problem: Driver is limiting performance due to temperature")
-                print(f"    Solution: Improve airflow, reduce ambient temperature")
-                print()
-
-            if mask & 0x0004:
+            for bit, color_attr, headline, problem, solution in _SUMMARY_CHECKS:
+                if not (mask & bit):
+                    continue
                 problems_found = True
-                print(f"  {self.term.YELLOW}⚠ POWER CAP{self.term.RESET}")
-                print(f"    Problem: Software power limit is restricting performance")
-                print(f"    Solution: Use 'sudo nvidia-smi -pl <watts>' to increase limit")
+                color = getattr(self.term, color_attr)
+                print(f"  {color}{headline}{self.term.RESET}")
+                print(f"    Problem: {problem.format(temp=temp)}")
+                print(f"    Solution: {solution}")
                 print()
 
             if not problems_found:
@@ -418,9 +1019,32 @@ class GPUMonitor:
         if self.csvf:
             print(f"\n{self.term.GREEN}CSV log saved to: {self.args.csv}{self.term.RESET}")
 
+    def _wait_for_tick(self, interval: float):
+        """Sleep via select() so a keystroke (or signal) wakes the loop
+        immediately instead of burning the rest of the tick"""
+        fds = [sys.stdin] if self._watch_stdin else []
+        try:
+            rlist, _, _ = select.select(fds, [], [], interval)
+        except (OSError, ValueError):
+            time.sleep(interval)
+            return
+        if rlist:
+            key = os.read(sys.stdin.fileno(), 1)
+            if not key:
+                # EOF: stop watching or select() would spin
+                self._watch_stdin = False
+            elif key in (b"q", b"Q"):
+                self.stop_flag = True
+
     def run(self):
-        """Main monitoring loop"""
+        """Main monitoring loop: render from snapshots while a daemon
+        thread samples, so NVML jitter never stalls the display"""
         self.term.hide_cursor()
+        self.term.clear_screen()
+        self.term.enter_cbreak()
+
+        sampler = threading.Thread(target=self._sampler_loop, daemon=True)
+        sampler.start()
 
         try:
             deadline = self.start_time + self.args.duration if self.args.duration > 0 else None
@@ -429,17 +1053,36 @@ class GPUMonitor:
                 if deadline and time.time() >= deadline:
                     break
 
-                self.update_display()
-                time.sleep(self.args.interval)
+                if not self._suspended:
+                    self.update_display()
+                self._wait_for_tick(self.args.interval)
+
+            if self._sample_error:
+                raise self._sample_error
 
         finally:
             # Cleanup
+            self.stop_flag = True
+            self._wake.set()
+            sampler.join(timeout=self.args.interval + 1.0)
+
+            self.term.exit_cbreak()
             self.term.show_cursor()
             self.term.clear_screen()
 
             if self.csvf:
                 self.csvf.close()
 
+            # If we exited before a snapshot was ever rendered (Ctrl-C
+            # or --duration inside the first tick), take one direct pass
+            # now so the summary still has per-GPU data
+            if not self._last_per_gpu:
+                try:
+                    samples = self.backend.sample_all()
+                    self._last_per_gpu = {i: samples[i] for i in self.gpu_indices}
+                except Exception:
+                    pass
+
             self.backend.close()
 
             # Show summary
@@ -31,6 +31,7 @@ setup(
     python_requires=">=3.6",
     extras_require={
         "nvml": ["pynvml"],
+        "fast": ["numpy"],
     },
     entry_points={
         "console_scripts": [